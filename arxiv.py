@@ -1,73 +1,180 @@
 import argparse
-import feedparser
-from datetime import datetime
-import json
+import asyncio
+import aiohttp
+from lxml import etree
+import orjson
 import csv
+from collections import namedtuple
 
-def fetch_arxiv_data(category="cs.AI", max_results=100, start_index=0, sort_order="descending"):
+# Maximum number of results requested per arXiv API call
+PAGE_SIZE = 1000
+# arXiv's API terms ask for no more than one request every 3 seconds, so page
+# downloads are serialized and spaced; only parsing overlaps with the next download
+MAX_CONCURRENT_REQUESTS = 1
+REQUEST_INTERVAL = 3  # seconds
+# Retry policy for overloaded responses (arXiv answers 503 under load)
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 60  # seconds
+RETRY_STATUSES = (429, 503)
+
+# XML namespaces used by the arXiv Atom feed
+NS = {"a": "http://www.w3.org/2005/Atom", "arx": "http://arxiv.org/schemas/atom"}
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+# Translation table flattening line breaks and tabs in titles/abstracts to spaces
+_WS_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# Output field names, in order (also the JSON keys and the CSV header)
+FIELDS = ("id", "submitter", "published", "authors", "title", "comments",
+          "journal-ref", "doi", "report-no", "categories", "license", "abstract")
+# Lightweight positional paper record; hyphens are not valid in attribute names
+Paper = namedtuple("Paper", [field.replace("-", "_") for field in FIELDS])
+
+def parse_entries(content):
     """
-    Fetch arXiv data using the provided API parameters.
+    Parse an arXiv API Atom response into Paper records.
     
     Parameters:
-        category (str): arXiv category (e.g., 'cs.AI')
-        max_results (int): Number of results to fetch from the API.
-        start_index (int): The starting index for the results.
-        sort_order (str): Sorting order ('ascending' or 'descending').
+        content (bytes): Raw body of the API response.
+    
+    Returns:
+        list: A list of Paper records.
+    """
+    root = etree.fromstring(content, _XML_PARSER)
+
+    papers = []
+    for entry in root.iterfind("a:entry", NS):
+        # The feed emits ISO-8601 timestamps, so the date is the first 10 characters
+        published = entry.findtext("a:published", default="", namespaces=NS)[:10]
+        category = entry.find("a:category", NS)
+        # Authors with an empty <name/> are skipped rather than failing the whole page
+        author_names = [author.findtext("a:name", default="", namespaces=NS).strip()
+                        for author in entry.iterfind("a:author", NS)]
+        paper = Paper(
+            id=entry.findtext("a:id", default="", namespaces=NS).split('/abs/')[-1],
+            submitter=None,
+            published=published,
+            authors=[name for name in author_names if name],
+            title=entry.findtext("a:title", default="", namespaces=NS).translate(_WS_TABLE).strip(),
+            comments=entry.findtext("arx:comment", namespaces=NS),
+            journal_ref=entry.findtext("arx:journal_ref", namespaces=NS),
+            doi=entry.findtext("arx:doi", namespaces=NS),
+            report_no=entry.findtext("arx:report_no", namespaces=NS),
+            categories=category.get("term") if category is not None else None,
+            license=entry.findtext("arx:license", namespaces=NS),
+            abstract=entry.findtext("a:summary", default="", namespaces=NS).translate(_WS_TABLE).strip()
+        )
+        papers.append(paper)
+
+    return papers
+
+async def fetch_page(session, semaphore, category, start, page_size, sort_order, last_page=False):
+    """
+    Fetch a single page of arXiv results and parse it off the event loop.
+    The semaphore is held for REQUEST_INTERVAL after the download completes (except
+    for the last page), so consecutive API requests are spaced as arXiv asks.
+    429/503 responses are retried with exponential backoff, honouring Retry-After.
+    A page that still fails is reported and skipped, so it does not discard the
+    pages already downloaded.
     
     Returns:
-        list: A list of dictionaries containing paper details.
+        list: A list of Paper records.
     """
     base_url = "http://export.arxiv.org/api/query?"
-    query = (f"search_query=cat:{category}&start={start_index}&max_results={max_results}"
+    query = (f"search_query=cat:{category}&start={start}&max_results={page_size}"
              f"&sortBy=submittedDate&sortOrder={sort_order}")
     feed_url = base_url + query
 
-    print(f"Fetching: {feed_url}")
-    feed = feedparser.parse(feed_url)
+    async with semaphore:
+        print(f"Fetching: {feed_url}")
+        content = None
+        try:
+            for attempt in range(MAX_ATTEMPTS):
+                async with session.get(feed_url) as response:
+                    if response.status not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                        response.raise_for_status()
+                        content = await response.read()
+                        break
+                    retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(REQUEST_INTERVAL, min(MAX_BACKOFF, int(retry_after)))
+                else:
+                    delay = min(MAX_BACKOFF, REQUEST_INTERVAL * 2 ** attempt)
+                print(f"arXiv returned {response.status}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+        except Exception as e:
+            print(f"Error fetching arXiv results starting at {start}:", e)
+        if not last_page:
+            await asyncio.sleep(REQUEST_INTERVAL)
+    if content is None:
+        return []
 
-    papers = []
-    for entry in feed.entries:
-        # Parse the published date as a datetime object
-        published = datetime.strptime(entry.published, '%Y-%m-%dT%H:%M:%SZ')
-        paper = {
-            "id": entry.id.split('/abs/')[-1],
-            "submitter": None,
-            "published": published.strftime('%Y-%m-%d'),
-            "authors": ', '.join(author.name for author in entry.authors),
-            "title": entry.title.strip().replace('\n', ' '),
-            "comments": entry.get("arxiv_comment", None),
-            "journal-ref": entry.get("arxiv_journal_ref", None),
-            "doi": entry.get("arxiv_doi", None),
-            "report-no": entry.get("arxiv_report_no", None),
-            "categories": entry.tags[0]['term'] if entry.tags else None,
-            "license": entry.get("arxiv_license", None),
-            "abstract": entry.summary.strip().replace('\n', ' ')
-        }
-        papers.append(paper)
+    # Parsing is CPU-bound, so keep it off the I/O thread
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, parse_entries, content)
+    except Exception as e:
+        print(f"Error parsing arXiv results starting at {start}:", e)
+        return []
 
-    return papers
+async def fetch_all(category, total, start_index=0, sort_order="descending", page_size=PAGE_SIZE):
+    """
+    Fetch `total` arXiv results starting at `start_index`, one page request at a time
+    while earlier pages are parsed concurrently. Pages are requested in order (the
+    semaphore wakes waiters first-in, first-out), so the last page is fetched last.
+    
+    Returns:
+        list: A list of Paper records, in API order (pages that failed are missing).
+    """
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    end_index = start_index + total
+    starts = range(start_index, end_index, page_size)
+    headers = {"Accept-Encoding": "gzip, deflate"}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        pages = await asyncio.gather(
+            *[fetch_page(session, semaphore, category, start, min(page_size, end_index - start), sort_order,
+                         last_page=(start == starts[-1]))
+              for start in starts]
+        )
+    return [paper for page in pages for paper in page]
+
+def fetch_arxiv_data(category="cs.AI", max_results=100, start_index=0, sort_order="descending"):
+    """
+    Fetch arXiv data using the provided API parameters.
+    Requests larger than PAGE_SIZE are split into pages, fetched at arXiv's rate limit.
+    
+    Parameters:
+        category (str): arXiv category (e.g., 'cs.AI')
+        max_results (int): Number of results to fetch from the API.
+        start_index (int): The starting index for the results.
+        sort_order (str): Sorting order ('ascending' or 'descending').
+    
+    Returns:
+        list: A list of Paper records.
+    """
+    return asyncio.run(fetch_all(category, max_results, start_index=start_index, sort_order=sort_order))
 
 def save_data(papers, output_format="json", output_file="arxiv_data"):
     """
     Save the paper data to a file in JSON or CSV format.
     
     Parameters:
-        papers (list): List of paper dictionaries.
+        papers (list): List of Paper records.
         output_format (str): The file format to save (either 'json' or 'csv').
         output_file (str): Output file name without extension.
     """
     if output_format == "json":
         filename = f"{output_file}.json"
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(papers, f, ensure_ascii=False, indent=4)
+        with open(filename, "wb") as f:
+            records = [dict(zip(FIELDS, paper)) for paper in papers]
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     elif output_format == "csv":
         filename = f"{output_file}.csv"
         if papers:
-            keys = papers[0].keys()
             with open(filename, "w", newline='', encoding="utf-8") as f:
-                dict_writer = csv.DictWriter(f, keys)
-                dict_writer.writeheader()
-                dict_writer.writerows(papers)
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+                # Authors are kept as a list; CSV cells get the comma-separated form
+                writer.writerows(paper._replace(authors=', '.join(paper.authors)) for paper in papers)
         else:
             with open(filename, "w", newline='', encoding="utf-8") as f:
                 f.write("")  # Create an empty file
@@ -1,53 +1,128 @@
 import argparse
-import json
-import requests
+import asyncio
+import mmap
+import os
+import random
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+import orjson
 from bs4 import BeautifulSoup
-import time
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
 from urllib.parse import quote
 
-def get_scholar_data(query):
+# Maximum number of concurrent requests to Google Scholar (kept low to avoid CAPTCHAs)
+MAX_CONCURRENT_REQUESTS = 5
+# Number of papers scraped at the same time (bounds memory and time-to-first-write)
+MAX_CONCURRENT_PAPERS = 5
+# Connection pool size and per-request timeout (seconds) for the shared session
+MAX_CONNECTIONS = 20
+REQUEST_TIMEOUT = 10
+# Retry policy for throttled responses (often a precursor to a CAPTCHA)
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 60  # seconds
+RETRY_STATUSES = (429, 503)
+# On-disk cache of successful Scholar responses, so re-runs only re-parse
+CACHE_NAME = "scholar_cache"
+CACHE_EXPIRE_AFTER = 86400  # seconds
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Encoding": "gzip, deflate"
+}
+
+# CSS selectors / XPath used on search result pages, compiled once at import
+_SEL_RESULT = CSSSelector(".gs_r")
+_SEL_RESULT_TITLE = CSSSelector(".gs_rt")
+_SEL_RESULT_DISPLAYED_LINK = CSSSelector(".gs_a")
+_SEL_RESULT_SNIPPET = CSSSelector(".gs_rs")
+_SEL_RESULT_CITED = CSSSelector(".gs_nph+ a")
+_XPATH_FIRST_LINK = etree.XPath("(.//a)[1]")
+_XPATH_RESULT_VERSIONS = etree.XPath("(.//a[preceding-sibling::a])[1]/following-sibling::a[1]")
+
+# CSS selectors used on author profile pages, compiled to XPath once at import
+_SEL_PROFILE_NAME = CSSSelector("#gsc_prf_in")
+_SEL_PROFILE_POSITION = CSSSelector("#gsc_prf_inw+ .gsc_prf_il")
+_SEL_PROFILE_EMAIL = CSSSelector("#gsc_prf_ivh")
+_SEL_PROFILE_DEPARTMENTS = CSSSelector("#gsc_prf_int")
+_SEL_ARTICLE = CSSSelector("#gsc_a_b .gsc_a_t")
+_SEL_TITLE = CSSSelector(".gsc_a_at")
+_SEL_GRAY = CSSSelector(".gs_gray")
+_SEL_TOTAL_CITES = CSSSelector("tr:nth-child(1) .gsc_rsb_std")
+_SEL_H_INDEX = CSSSelector("tr:nth-child(2) .gsc_rsb_std")
+_SEL_I_INDEX = CSSSelector("tr:nth-child(3) .gsc_rsb_std")
+
+def create_cache():
+    """
+    Create the SQLite cache of successful Scholar responses, keyed by URL, so repeated
+    lookups (e.g. after a run interrupted by a CAPTCHA) do not hit Scholar again.
+    Requires the aiohttp-client-cache[sqlite] extra.
+    """
+    return SQLiteBackend(cache_name=CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER, allowed_codes=(200,))
+
+def create_session(cache):
+    """
+    Create the HTTP session shared by all Scholar requests, backed by `cache`.
+    Connections are kept alive and pooled, and default headers are set once.
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    return CachedSession(cache=cache, headers=HEADERS, connector=connector, timeout=timeout)
+
+async def fetch_html(session, semaphore, url):
+    """
+    Fetch a page through the shared session and return its body as text, decoded
+    with the charset from the response's Content-Type header.
+    Successful responses return immediately; throttled responses (429/503) are
+    retried with jittered exponential backoff so concurrent tasks do not retry
+    in lockstep.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        async with semaphore:
+            async with session.get(url) as response:
+                if response.status not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    response.raise_for_status()
+                    return await response.text()
+        await asyncio.sleep(min(MAX_BACKOFF, 2 ** attempt + random.random()))
+
+async def get_scholar_data(session, semaphore, query):
     """
     Scrape Google Scholar organic search results for a given query.
     The query is expected to be a string (e.g. a paper title enclosed in quotes).
     """
     url = "https://www.google.com/scholar?q=" + quote(query)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    }
     try:
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        text = await fetch_html(session, semaphore, url)
+        tree = html.fromstring(text)
         results = []
-        for el in soup.select(".gs_r"):
+        for el in _SEL_RESULT(tree):
             try:
                 result = {}
                 # Get title and title link
-                title_el = el.select_one(".gs_rt")
+                title_el = _SEL_RESULT_TITLE(el)
                 if title_el:
-                    result["title"] = title_el.get_text()
-                    a_tag = title_el.find("a")
-                    if a_tag and 'href' in a_tag.attrs:
-                        result["title_link"] = a_tag["href"]
-                        result["id"] = a_tag.get("id", "")
+                    result["title"] = title_el[0].text_content()
+                    a_tag = _XPATH_FIRST_LINK(title_el[0])
+                    if a_tag and a_tag[0].get("href") is not None:
+                        result["title_link"] = a_tag[0].get("href")
+                        result["id"] = a_tag[0].get("id", "")
                 # Displayed link and snippet
-                displayed_link = el.select_one(".gs_a")
+                displayed_link = _SEL_RESULT_DISPLAYED_LINK(el)
                 if displayed_link:
-                    result["displayed_link"] = displayed_link.get_text()
-                snippet = el.select_one(".gs_rs")
+                    result["displayed_link"] = displayed_link[0].text_content()
+                snippet = _SEL_RESULT_SNIPPET(el)
                 if snippet:
-                    result["snippet"] = snippet.get_text(strip=True)
+                    result["snippet"] = "".join(text.strip() for text in snippet[0].itertext())
                 # Cited by info
-                cited_a = el.select_one(".gs_nph+ a")
+                cited_a = _SEL_RESULT_CITED(el)
                 if cited_a:
-                    result["cited_by_count"] = cited_a.get_text()
-                    result["cited_link"] = "https://scholar.google.com" + cited_a.get("href", "")
-                # Versions info (if available)
-                versions_el = el.select("a ~ a")
-                if versions_el and len(versions_el) >= 1:
-                    ver_el = versions_el[0].find_next_sibling("a")
-                    if ver_el:
-                        result["versions_count"] = ver_el.get_text()
-                        result["versions_link"] = "https://scholar.google.com" + ver_el.get("href", "")
+                    result["cited_by_count"] = cited_a[0].text_content()
+                    result["cited_link"] = "https://scholar.google.com" + cited_a[0].get("href", "")
+                # Versions info (if available): the link following the first "a ~ a" match
+                ver_el = _XPATH_RESULT_VERSIONS(el)
+                if ver_el:
+                    result["versions_count"] = ver_el[0].text_content()
+                    result["versions_link"] = "https://scholar.google.com" + ver_el[0].get("href", "")
                 # Remove empty fields
                 result = {k: v for k, v in result.items() if v}
                 results.append(result)
@@ -58,21 +133,18 @@ def get_scholar_data(query):
         print("Error fetching Google Scholar data:", e)
         return []
 
-def get_scholar_profiles(author_name):
+async def get_scholar_profiles(session, semaphore, author_name):
     """
     Scrape Google Scholar author search results for a given author name.
-    Returns a list of profile dictionaries.
+    Returns a list of profile dictionaries, or None if the search failed.
     """
     base_url = "https://scholar.google.com/citations?hl=en&view_op=search_authors&mauthors="
     query = quote(author_name)
     url = base_url + query
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    }
     profiles = []
     try:
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        text = await fetch_html(session, semaphore, url)
+        soup = BeautifulSoup(text, 'lxml')
         for el in soup.select('.gsc_1usr'):
             profile = {}
             name_el = el.select_one('.gs_ai_name')
@@ -99,50 +171,48 @@ def get_scholar_profiles(author_name):
         return profiles
     except Exception as e:
         print("Error fetching scholar profiles for author:", author_name, e)
-        return []
+        return None
 
-def get_author_profile_data(profile_url):
+async def get_author_profile_data(session, semaphore, profile_url):
     """
     Scrape detailed author profile data from a Google Scholar profile URL.
     This includes basic info, published articles, and citation metrics.
+    Returns None if the profile page could not be fetched or parsed.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    }
     try:
-        response = requests.get(profile_url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        text = await fetch_html(session, semaphore, profile_url)
+        tree = html.fromstring(text)
         profile_data = {}
         # Basic info extraction
-        name_el = soup.select_one("#gsc_prf_in")
+        name_el = _SEL_PROFILE_NAME(tree)
         if name_el:
-            profile_data["name"] = name_el.get_text()
-        pos_el = soup.select_one("#gsc_prf_inw+ .gsc_prf_il")
+            profile_data["name"] = name_el[0].text_content()
+        pos_el = _SEL_PROFILE_POSITION(tree)
         if pos_el:
-            profile_data["position"] = pos_el.get_text()
-        email_el = soup.select_one("#gsc_prf_ivh")
+            profile_data["position"] = pos_el[0].text_content()
+        email_el = _SEL_PROFILE_EMAIL(tree)
         if email_el:
-            profile_data["email"] = email_el.get_text()
-        dept_el = soup.select_one("#gsc_prf_int")
+            profile_data["email"] = email_el[0].text_content()
+        dept_el = _SEL_PROFILE_DEPARTMENTS(tree)
         if dept_el:
-            profile_data["departments"] = dept_el.get_text()
+            profile_data["departments"] = dept_el[0].text_content()
         
         # Articles extraction
         articles = []
-        for el in soup.select("#gsc_a_b .gsc_a_t"):
+        for el in _SEL_ARTICLE(tree):
             article = {}
-            title_el = el.select_one(".gsc_a_at")
+            title_el = _SEL_TITLE(el)
             if title_el:
-                article["title"] = title_el.get_text()
-                article_link = title_el.get("href", "")
+                article["title"] = title_el[0].text_content()
+                article_link = title_el[0].get("href", "")
                 if article_link:
                     article["link"] = "https://scholar.google.com" + article_link
-            authors_el = el.select_one(".gs_gray")
-            if authors_el:
-                article["authors"] = authors_el.get_text()
-            pubs = el.select(".gs_gray")
-            if len(pubs) > 1:
-                article["publication"] = pubs[1].get_text()
+            # The first gray line holds the authors, the second the publication
+            grays = _SEL_GRAY(el)
+            if grays:
+                article["authors"] = grays[0].text_content()
+            if len(grays) > 1:
+                article["publication"] = grays[1].text_content()
             article = {k: v for k, v in article.items() if v}
             articles.append(article)
         profile_data["articles"] = articles
@@ -152,21 +222,21 @@ def get_author_profile_data(profile_url):
         try:
             # Total citations
             row = {}
-            total_cites = soup.select_one("tr:nth-child(1) .gsc_rsb_std")
+            total_cites = _SEL_TOTAL_CITES(tree)
             if total_cites:
-                row['citations'] = {"all": total_cites.get_text()}
+                row['citations'] = {"all": total_cites[0].text_content()}
             table.append(row)
             # h-index
             row = {}
-            h_index_all = soup.select_one("tr:nth-child(2) .gsc_rsb_std")
+            h_index_all = _SEL_H_INDEX(tree)
             if h_index_all:
-                row['h_index'] = {"all": h_index_all.get_text()}
+                row['h_index'] = {"all": h_index_all[0].text_content()}
             table.append(row)
             # i-index
             row = {}
-            i_index_all = soup.select_one("tr:nth-child(3) .gsc_rsb_std")
+            i_index_all = _SEL_I_INDEX(tree)
             if i_index_all:
-                row['i_index'] = {"all": i_index_all.get_text()}
+                row['i_index'] = {"all": i_index_all[0].text_content()}
             table.append(row)
         except Exception as e:
             print("Error parsing citation metrics:", e)
@@ -175,67 +245,267 @@ def get_author_profile_data(profile_url):
         return profile_data
     except Exception as e:
         print("Error fetching author profile data from", profile_url, e)
+        return None
+
+def iter_ndjson_papers(f):
+    """
+    Yield one decoded paper per non-empty line of an open NDJSON file,
+    closing the file once it is exhausted.
+    """
+    with f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def load_arxiv_papers(path):
+    """
+    Load arXiv papers from a JSON array file, or from an NDJSON file (one paper
+    per line) when the path ends with '.ndjson'.
+    JSON arrays are memory-mapped and decoded by orjson without an intermediate str.
+    NDJSON input is streamed: the file is opened here, but papers are decoded lazily
+    as they are consumed, so the whole input is never held in memory.
+    """
+    if path.endswith(".ndjson"):
+        return iter_ndjson_papers(open(path, "rb"))
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buffer:
+                return orjson.loads(buffer)
+
+def load_processed_ids(path):
+    """
+    Return the arXiv ids already written to the NDJSON output by previous runs.
+    A last line that does not parse (left incomplete by a crash) is ignored.
+    Raises ValueError if the file is not an NDJSON final database, so that a
+    file in another format is never appended to.
+    """
+    processed_ids = set()
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return processed_ids
+    with f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                if not line.endswith(b"\n"):
+                    break
+                raise ValueError(f"{path} is not an NDJSON final database (line {number} is not valid JSON)")
+            if not isinstance(entry, dict) or not isinstance(entry.get("arxiv"), dict):
+                raise ValueError(f"{path} is not an NDJSON final database (line {number} is not a paper entry)")
+            processed_ids.add(entry["arxiv"].get("id"))
+    processed_ids.discard(None)
+    return processed_ids
+
+def repair_output_tail(path, block_size=65536):
+    """
+    Make sure the NDJSON output ends with a newline before new entries are appended.
+    A complete last entry that only lacks its newline gets one; a last line that
+    does not parse (an interrupted write) is truncated, with a warning.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        # Scan backwards for the start of the last line
+        line_start = size
+        while line_start > 0:
+            step = min(block_size, line_start)
+            f.seek(line_start - step)
+            index = f.read(step).rfind(b"\n")
+            if index != -1:
+                line_start = line_start - step + index + 1
+                break
+            line_start -= step
+        f.seek(line_start)
+        fragment = f.read()
+        try:
+            orjson.loads(fragment)
+        except orjson.JSONDecodeError:
+            print(f"Warning: dropping incomplete last line ({len(fragment)} bytes) from {path}")
+            f.truncate(line_start)
+        else:
+            f.write(b"\n")
+
+def load_author_profiles(path):
+    """
+    Load the author name -> detailed profiles mapping saved by a previous run.
+    Returns an empty dict if the file does not exist or cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
         return {}
+    except Exception as e:
+        print("Error loading author profiles cache:", e)
+        return {}
+
+def save_author_profiles(path, known_authors):
+    """
+    Persist the author name -> detailed profiles mapping for future runs.
+    The data is written to a temporary file that then replaces the cache, so an
+    interrupted save cannot leave a corrupt cache behind.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(known_authors))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print("Error saving author profiles cache:", e)
+
+async def fetch_author_profiles(session, semaphore, author):
+    """
+    Look up an author's Google Scholar profiles and fetch detailed data for each profile.
+    Returns None if the profile search or any profile page fetch failed, so that
+    incomplete results are never cached.
+    """
+    print("  Processing author:", author)
+    profiles = await get_scholar_profiles(session, semaphore, author)
+    if profiles is None:
+        return None
+    detailed_profiles = []
+    for profile in profiles:
+        if "name_link" in profile:
+            profile_url = profile["name_link"]
+            profile_data = await get_author_profile_data(session, semaphore, profile_url)
+            if profile_data is None:
+                return None
+            combined_profile = {**profile, **profile_data}
+            detailed_profiles.append(combined_profile)
+    return detailed_profiles
+
+async def get_author_profiles(session, semaphore, author, known_authors, pending_authors):
+    """
+    Return the detailed profiles for an author, scraping Scholar only the first time
+    the name is seen. known_authors holds finished lookups (persisted between runs);
+    pending_authors holds lookups still in flight, shared by concurrently processed papers.
+    Authors without any Scholar profile are stored with an empty list so they are not
+    searched again; failed lookups (search or profile pages) are not stored and are
+    retried on the next run.
+    """
+    if author in known_authors:
+        return known_authors[author]
+    if author not in pending_authors:
+        pending_authors[author] = asyncio.ensure_future(fetch_author_profiles(session, semaphore, author))
+    profiles = await pending_authors[author]
+    if profiles is None:
+        return []
+    known_authors[author] = profiles
+    return profiles
+
+async def process_paper(session, semaphore, paper, known_authors, pending_authors):
+    """
+    Build the database entry for one arXiv paper: the Scholar search results for its
+    title plus the Scholar profiles of each of its authors (fetched concurrently).
+    """
+    print("Processing paper:", paper.get("title", ""))
+    paper_entry = {"arxiv": paper}
+    
+    # Google Scholar search using the paper title (enclosed in quotes)
+    query = f'"{paper.get("title", "")}"'
+    scholar_results = await get_scholar_data(session, semaphore, query)
+    paper_entry["scholar_search"] = scholar_results
+    
+    # Process authors from arXiv data (a list; older exports used a comma-separated string)
+    authors_list = paper.get("authors", [])
+    if isinstance(authors_list, str):
+        authors_list = [a.strip() for a in authors_list.split(",") if a.strip()]
+    authors_profiles = await asyncio.gather(
+        *[get_author_profiles(session, semaphore, author, known_authors, pending_authors)
+          for author in authors_list]
+    )
+    paper_entry["authors_details"] = [
+        {"author_name": author, "profiles": profiles}
+        for author, profiles in zip(authors_list, authors_profiles)
+    ]
+    
+    return paper_entry
+
+async def process_papers(arxiv_papers, out_file, known_authors, cache):
+    """
+    Run the Google Scholar scraping for every arXiv paper. MAX_CONCURRENT_PAPERS
+    workers pull papers from arxiv_papers (any iterable, consumed lazily), and the
+    shared semaphore bounds the number of in-flight requests.
+    Each paper entry is appended to out_file (opened in binary mode) as one NDJSON
+    line as soon as it is complete, so progress survives a crash mid-run.
+    Entries therefore appear in completion order rather than input order.
+    Authors already in known_authors are not looked up again, and newly scraped
+    authors are added to it.
+    """
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    pending_authors = {}
+    async with create_session(cache) as session:
+        # All workers share one iterator, so each paper is handed to exactly one worker
+        papers = iter(arxiv_papers)
+        
+        async def worker():
+            for paper in papers:
+                paper_entry = await process_paper(session, semaphore, paper, known_authors, pending_authors)
+                out_file.write(orjson.dumps(paper_entry))
+                out_file.write(b"\n")
+                out_file.flush()
+        
+        await asyncio.gather(*[worker() for _ in range(MAX_CONCURRENT_PAPERS)])
 
 def main():
     parser = argparse.ArgumentParser(
         description="Build a database from arXiv data with additional Google Scholar scraping."
     )
-    parser.add_argument('--arxiv_data', type=str, default="arxiv_data.json", help="Input arXiv data JSON file")
-    parser.add_argument('--output', type=str, default="final_database.json", help="Output final database JSON file")
+    parser.add_argument('--arxiv_data', type=str, default="arxiv_data.json", help="Input arXiv data JSON (or .ndjson) file")
+    parser.add_argument('--output', type=str, default="final_database.ndjson", help="Output final database NDJSON file (one paper per line; papers already in it are skipped)")
+    parser.add_argument('--authors_cache', type=str, default="author_profiles.json", help="JSON file of already scraped author profiles, reused across runs")
     args = parser.parse_args()
     
     # Load arXiv data
     try:
-        with open(args.arxiv_data, "r", encoding="utf-8") as f:
-            arxiv_papers = json.load(f)
+        arxiv_papers = load_arxiv_papers(args.arxiv_data)
     except Exception as e:
         print("Error loading arXiv data:", e)
         return
     
-    final_database = []
+    # Skip papers already written to the output by an earlier (possibly interrupted) run
+    try:
+        processed_ids = load_processed_ids(args.output)
+        repair_output_tail(args.output)
+    except Exception as e:
+        print("Error reading existing final database:", e)
+        return
+    if processed_ids:
+        print(f"Resuming: skipping {len(processed_ids)} papers already in {args.output}")
+        arxiv_papers = (paper for paper in arxiv_papers if paper.get("id") not in processed_ids)
     
-    # Process each arXiv paper
-    for paper in arxiv_papers:
-        print("Processing paper:", paper.get("title", ""))
-        paper_entry = {"arxiv": paper}
-        
-        # Google Scholar search using the paper title (enclosed in quotes)
-        query = f'"{paper.get("title", "")}"'
-        scholar_results = get_scholar_data(query)
-        paper_entry["scholar_search"] = scholar_results
-        
-        # Process authors from arXiv data (assumed comma-separated string)
-        authors_list = [a.strip() for a in paper.get("authors", "").split(",") if a.strip()]
-        authors_details = []
-        for author in authors_list:
-            print("  Processing author:", author)
-            author_entry = {"author_name": author}
-            profiles = get_scholar_profiles(author)
-            detailed_profiles = []
-            for profile in profiles:
-                if "name_link" in profile:
-                    profile_url = profile["name_link"]
-                    profile_data = get_author_profile_data(profile_url)
-                    combined_profile = {**profile, **profile_data}
-                    detailed_profiles.append(combined_profile)
-                    # Sleep briefly to avoid being blocked
-                    time.sleep(1)
-            author_entry["profiles"] = detailed_profiles
-            authors_details.append(author_entry)
-            time.sleep(1)
-        paper_entry["authors_details"] = authors_details
-        
-        final_database.append(paper_entry)
-        time.sleep(2)
+    # Load author profiles scraped by previous runs
+    known_authors = load_author_profiles(args.authors_cache)
+    
+    # Set up the Scholar response cache before touching the output file
+    try:
+        cache = create_cache()
+    except Exception as e:
+        print("Error setting up Scholar response cache:", e)
+        return
     
-    # Save the final database to a JSON file
+    # Scrape Google Scholar, appending each paper entry to the final database NDJSON file
     try:
-        with open(args.output, "w", encoding="utf-8") as out_file:
-            json.dump(final_database, out_file, ensure_ascii=False, indent=4)
+        with open(args.output, "ab") as out_file:
+            asyncio.run(process_papers(arxiv_papers, out_file, known_authors, cache))
         print(f"Final database saved to {args.output}")
     except Exception as e:
-        print("Error saving final database:", e)
+        print("Error building final database:", e)
+    finally:
+        # Save the author profiles (including partial progress, even on Ctrl-C) for the next run
+        save_author_profiles(args.authors_cache, known_authors)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file